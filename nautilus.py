@@ -1,28 +1,98 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import argparse
-import yaml
+import hashlib
+import json
+import os
+import sys
+import time
 
-from kubernetes import client, config
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+DISCOVERY_CACHE_DIR = os.path.expanduser(os.path.join("~", ".kube", "cache", "discovery"))
+DISCOVERY_CACHE_TTL = 600
+LIST_PAGE_SIZE = 500
+DASHBOARD_WORKERS = 4
+APPLY_WORKERS = 8
+APPLY_QUEUE_SIZE = 2 * APPLY_WORKERS
+CONNECTION_POOL_SIZE = 16
+
+# Marks printer arguments that were not prefetched; None means the fetch failed.
+_UNSET = object()
+
+# Resource kind -> (API attribute, create method, patch method) used by apply().
+_KIND_DISPATCH = {
+    "deployment": ("apps_v1", "create_namespaced_deployment", "patch_namespaced_deployment"),
+    "service": ("v1", "create_namespaced_service", "patch_namespaced_service"),
+    "pod": ("v1", "create_namespaced_pod", "patch_namespaced_pod"),
+}
+
 
 class DescribeK8s:
     """Initialize the DescribeK8s object with the given namespace."""
 
     def __init__(self, namespace):
+        from kubernetes import config
+
         self.config = config.load_kube_config()    
         self.namespace = namespace
-        self.v1 = client.CoreV1Api()
+        self._build_clients()
+
+    def _build_clients(self):
+        """Build the API objects for the currently loaded kubeconfig context."""
+        from kubernetes import client
+
+        configuration = client.Configuration.get_default_copy()
+        # One keep-alive pool shared by every API object and worker thread.
+        configuration.connection_pool_maxsize = CONNECTION_POOL_SIZE
+        self.v1 = client.CoreV1Api(client.ApiClient(configuration))
+        self.apps_v1 = client.AppsV1Api(self.v1.api_client)
+        self._kind_funcs = {}
 
     def set_namespace(self, namespace):
         """Set the namespace for the DescribeK8s object."""
         self.namespace = namespace
 
-    def get_api_resources(self):
+    def _cached_discovery(self, key, fetch, ttl=DISCOVERY_CACHE_TTL):
+        """Return a cached discovery response, refreshing it once stale."""
+        api_client = self.v1.api_client
+        host = hashlib.sha256(api_client.configuration.host.encode()).hexdigest()[:16]
+        path = os.path.join(DISCOVERY_CACHE_DIR, host, key)
+        try:
+            if time.time() - os.stat(path).st_mtime < ttl:
+                with open(path, "rb") as f:
+                    return json_loads(f.read())
+        except Exception:
+            pass
+
+        raw = fetch(_preload_content=False).data
+        try:
+            os.makedirs(os.path.dirname(path), mode=0o750, exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(raw)
+        except OSError:
+            pass
+        return json_loads(raw)
+
+    def _fetch_api_resources(self):
+        """Fetch API resources information, raising on API errors."""
+        return self._cached_discovery(
+            os.path.join("v1", "serverresources.json"),
+            self.v1.get_api_resources)
+
+    def get_api_resources(self, fetch=None):
         """Get API resources information."""
+        from kubernetes import client
+
         try:
-            return self.v1.get_api_resources()
+            return (fetch or self._fetch_api_resources)()
         except client.ApiException as e:
             print(f"Error getting API resources: {e}")
             return None
@@ -34,8 +104,11 @@ class DescribeK8s:
 
     def get_kube_dns_info(self):
         """Get KubeDNS service information."""
+        from kubernetes import client
+
         try:
-            return self.v1.list_namespaced_service(self.namespace)
+            return self.v1.list_namespaced_service(
+                "kube-system", field_selector="metadata.name=kube-dns", limit=1)
         except client.ApiException as e:
             print(f"Error getting KubeDNS info: {e}")
             return None
@@ -43,17 +116,16 @@ class DescribeK8s:
     def get_kube_dns_url(self):
         """Get the KubeDNS URL."""
         kube_dns = self.get_kube_dns_info()
-        if kube_dns:
-            for service in kube_dns.items:
-                if service.metadata.name == "kube-dns":
-                    return service.spec.cluster_ip
+        if kube_dns and kube_dns.items:
+            return kube_dns.items[0].spec.cluster_ip
         return None
 
     def print_api_versions(self):
         """Print API versions information."""
+        from kubernetes import client
+
         try:
-            api_client = client.ApiClient()
-            version_api = client.VersionApi(api_client)
+            version_api = client.VersionApi(self.v1.api_client)
             api_versions = version_api.get_code()
             print("Kubernetes API Versions:")
             print(f"Major: {api_versions.major}")
@@ -62,88 +134,117 @@ class DescribeK8s:
         except client.ApiException as e:
             print(f"Error getting API versions: {e}")
 
-    def print_cluster_info(self):
+    def print_cluster_info(self, api_resources=_UNSET):
         """Print cluster information."""
-        api_resources = self.get_api_resources()
+        if api_resources is _UNSET:
+            api_resources = self.get_api_resources()
         if api_resources:
-            print(f"API Resources: {len(api_resources.resources)}")
+            print(f"API Resources: {len(api_resources.get('resources', []))}")
 
         host = self.v1.api_client.configuration.host
         print(
             f"KubeDNS is running at http://{host}/api/v1/namespaces/kube-system/services/kube-dns:dns/proxy")
         print(f"Kubernetes control plane is running at {host}")
 
-    def get_nodes(self):
+    def _list_items(self, list_func, limit=LIST_PAGE_SIZE, **kwargs):
+        """Return all items of a list endpoint as plain JSON dicts."""
+        items = []
+        _continue = None
+        while True:
+            resp = list_func(_preload_content=False, limit=limit, _continue=_continue, **kwargs)
+            data = json_loads(resp.data)
+            items.extend(data.get("items", []))
+            _continue = data.get("metadata", {}).get("continue")
+            if not _continue:
+                return items
+
+    def _fetch_nodes(self):
+        """Fetch all nodes in the cluster, raising on API errors."""
+        return self._list_items(self.v1.list_node, resource_version="0")
+
+    def get_nodes(self, fetch=None):
         """Get information about all nodes in the cluster."""
+        from kubernetes import client
+
         try:
-            nodes = self.v1.list_node()
-            return nodes.items
+            return (fetch or self._fetch_nodes)()
         except client.ApiException as e:
             print(f"Error getting nodes: {e}")
             return None
 
     # namespace commands
-    def get_all_namespaces(self):
+    def _fetch_namespaces(self):
+        """Fetch all namespaces in the cluster, raising on API errors."""
+        return self._list_items(self.v1.list_namespace, resource_version="0")
+
+    def get_all_namespaces(self, fetch=None):
         """List all available namespaces in the Kubernetes cluster."""
+        from kubernetes import client
+
         try:
-            api_response = self.v1.list_namespace()
-            namespaces = api_response.items
-            return namespaces
+            return (fetch or self._fetch_namespaces)()
         except client.ApiException as e:
             print(f"Exception when listing namespaces: {e}")
             return None
 
-    def print_namespaces_info(self):
+    def print_namespaces_info(self, namespaces=_UNSET):
         """Print information about all namespaces in the cluster."""
-        namespaces = self.get_all_namespaces()
-        print("NAMESPACE\tSTATUS\tAGE")
-        if namespaces:
-            for namespace in namespaces:
-                name = namespace.metadata.name
-                status = namespace.status.phase if namespace.status else "Unknown"
-                age = self.calculate_age(namespace.metadata.creation_timestamp)
-                print(f"{name}\t{status}\t{age}")
-        print()
+        if namespaces is _UNSET:
+            namespaces = self.get_all_namespaces()
+        now = datetime.now(timezone.utc)
+        rows = [("NAMESPACE", "STATUS", "AGE")]
+        rows.extend(
+            (namespace["metadata"]["name"],
+             namespace.get("status", {}).get("phase", "Unknown"),
+             self.calculate_age(self.parse_timestamp(namespace["metadata"]["creationTimestamp"]), now))
+            for namespace in namespaces or ())
+        sys.stdout.write("\n".join("\t".join(row) for row in rows) + "\n\n")
     
     def list_pods(self):
         """List all pods in the current namespace."""
+        from kubernetes import client
+
         try:
-            api_instance = client.CoreV1Api()
-            pod_list = api_instance.list_namespaced_pod(namespace=self.namespace)
+            pods = self._list_items(self.v1.list_namespaced_pod, namespace=self.namespace)
             
-            print(f"Pods in namespace '{self.namespace}':")
-            for pod in pod_list.items:
-                name = pod.metadata.name
-                status = pod.status.phase
-                ip = pod.status.pod_ip
-                node = pod.spec.node_name
+            out = [f"Pods in namespace '{self.namespace}':\n"]
+            for pod in pods:
+                name = pod["metadata"]["name"]
+                status = pod.get("status", {}).get("phase")
+                ip = pod.get("status", {}).get("podIP")
+                node = pod.get("spec", {}).get("nodeName")
                 
-                print(f"Name: {name}")
-                print(f"  Status: {status}")
-                print(f"  IP: {ip}")
-                print(f"  Node: {node}")
-                print("---")
+                out.append(
+                    f"Name: {name}\n"
+                    f"  Status: {status}\n"
+                    f"  IP: {ip}\n"
+                    f"  Node: {node}\n"
+                    "---\n")
+            sys.stdout.write("".join(out))
             
         except client.ApiException as e:
             print(f"Exception when calling CoreV1Api->list_namespaced_pod: {e}")
 
-    def print_nodes_info(self):
+    def print_nodes_info(self, nodes=_UNSET):
         """Print information about all nodes in the cluster."""
-        nodes = self.get_nodes()
+        if nodes is _UNSET:
+            nodes = self.get_nodes()
         if nodes:
-            print("Cluster Nodes:")
+            out = ["Cluster Nodes:\n"]
             for node in nodes:
-                print(f"  Name: {node.metadata.name}")
-                print(f"    Status: {node.status.phase}")
-                print(
-                    f"    Kubernetes Version: {node.status.node_info.kubelet_version}")
-                print(f"    OS Image: {node.status.node_info.os_image}")
-                print(
-                    f"    Container Runtime: {node.status.node_info.container_runtime_version}")
-                print("    Addresses:")
-                for address in node.status.addresses:
-                    print(f"      {address.type}: {address.address}")
-                print()
+                status = node.get("status", {})
+                node_info = status.get("nodeInfo", {})
+                out.append(
+                    f"  Name: {node['metadata']['name']}\n"
+                    f"    Status: {status.get('phase')}\n"
+                    f"    Kubernetes Version: {node_info.get('kubeletVersion')}\n"
+                    f"    OS Image: {node_info.get('osImage')}\n"
+                    f"    Container Runtime: {node_info.get('containerRuntimeVersion')}\n"
+                    "    Addresses:\n")
+                for address in status.get("addresses", []):
+                    out.append(f"      {address['type']}: {address['address']}\n")
+                out.append("\n")
+            sys.stdout.write("".join(out))
         else:
             print("No nodes found or error occurred while fetching nodes.")
 
@@ -151,6 +252,8 @@ class DescribeK8s:
 
     def switch_context(self, context_name):
         """Switch the active context."""
+        from kubernetes import config
+
         try:
             contexts, active_context = config.list_kube_config_contexts()
             if context_name not in [ctx['name'] for ctx in contexts]:
@@ -158,51 +261,77 @@ class DescribeK8s:
                 return False
             
             config.load_kube_config(context=context_name)
+            self._build_clients()
             print(f"Switched to context '{context_name}'")
             return True
         except Exception as e:
             print(f"Error switching context: {e}")
             return False
 
+    def _apply_document(self, doc):
+        """Create or update the resource described by one manifest document."""
+        from kubernetes import client
+
+        kind = doc.get("kind", "").lower()
+        name = doc["metadata"]["name"]
+
+        funcs = self._kind_funcs.get(kind)
+        if funcs is None:
+            entry = _KIND_DISPATCH.get(kind)
+            if entry is None:
+                return f"Unsupported resource kind: {kind}"
+            api_instance = getattr(self, entry[0])
+            funcs = self._kind_funcs[kind] = (getattr(api_instance, entry[1]), getattr(api_instance, entry[2]))
+        api_func, update_func = funcs
+
+        try:
+            api_func(body=doc, namespace=self.namespace)
+            return f"{kind.capitalize()} '{name}' created."
+        except client.ApiException as e:
+            if e.status == 409:  # Conflict, resource already exists
+                update_func(name=name, namespace=self.namespace, body=doc)
+                return f"{kind.capitalize()} '{name}' updated."
+            return f"Error applying {kind} '{name}': {e}"
+
+    @staticmethod
+    def _print_apply_result(future):
+        """Print the outcome of one applied manifest document."""
+        try:
+            print(future.result())
+        except Exception as e:
+            print(f"Error applying configuration: {e}")
+
     def apply(self, filename):
         """Apply a configuration file to create or update resources."""
+        import yaml
+        try:
+            from yaml import CSafeLoader as Loader
+        except ImportError:
+            from yaml import SafeLoader as Loader
+
+        # At most APPLY_QUEUE_SIZE documents are held between parsing and printing.
+        pending = deque()
+        parse_error = None
         try:
-            with open(filename, 'r') as f:
-                docs = yaml.safe_load_all(f)
-                for doc in docs:
-                    kind = doc.get("kind", "").lower()
-                    name = doc["metadata"]["name"]
-                    
-                    if kind == "deployment":
-                        api_instance = self.apps_v1
-                        api_func = api_instance.create_namespaced_deployment
-                        update_func = api_instance.patch_namespaced_deployment
-                    elif kind == "service":
-                        api_instance = self.v1
-                        api_func = api_instance.create_namespaced_service
-                        update_func = api_instance.patch_namespaced_service
-                    elif kind == "pod":
-                        api_instance = self.v1
-                        api_func = api_instance.create_namespaced_pod
-                        update_func = api_instance.patch_namespaced_pod
-                    else:
-                        print(f"Unsupported resource kind: {kind}")
-                        continue
-                    
-                    try:
-                        api_func(body=doc, namespace=self.namespace)
-                        print(f"{kind.capitalize()} '{name}' created.")
-                    except client.ApiException as e:
-                        if e.status == 409:  # Conflict, resource already exists
-                            update_func(name=name, namespace=self.namespace, body=doc)
-                            print(f"{kind.capitalize()} '{name}' updated.")
-                        else:
-                            print(f"Error applying {kind} '{name}': {e}")
+            with open(filename, 'rb') as f, ThreadPoolExecutor(max_workers=APPLY_WORKERS) as executor:
+                for doc in yaml.load_all(f, Loader=Loader):
+                    if len(pending) >= APPLY_QUEUE_SIZE:
+                        self._print_apply_result(pending.popleft())
+                    pending.append(executor.submit(self._apply_document, doc))
+                    while pending and pending[0].done():
+                        self._print_apply_result(pending.popleft())
         except Exception as e:
-            print(f"Error applying configuration: {e}")
+            parse_error = e
+
+        while pending:
+            self._print_apply_result(pending.popleft())
+        if parse_error is not None:
+            print(f"Error applying configuration: {parse_error}")
 
     def create(self, resource_type, name, image=None, replicas=None):
         """Create a new resource."""
+        from kubernetes import client
+
         try:
             if resource_type.lower() == "deployment":
                 body = client.V1Deployment(
@@ -241,18 +370,22 @@ class DescribeK8s:
             print(f"Error creating {resource_type}: {e}")
 
     @staticmethod
-    def calculate_age(creation_time):
-        """Calculate the age of a resource based on its creation time."""
-        now = datetime.now(timezone.utc)
-        age = now - creation_time
-        if age.days > 0:
-            return f"{age.days}d"
-        elif age.seconds >= 3600:
-            return f"{age.seconds // 3600}h"
-        elif age.seconds >= 60:
-            return f"{age.seconds // 60}m"
+    def parse_timestamp(timestamp):
+        """Parse an RFC 3339 timestamp as returned by the API server."""
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+
+    @staticmethod
+    def calculate_age(creation_time, now=None):
+        """Calculate the age of a resource relative to now."""
+        seconds = int(((now or datetime.now(timezone.utc)) - creation_time).total_seconds())
+        if seconds >= 86400:
+            return f"{seconds // 86400}d"
+        elif seconds >= 3600:
+            return f"{seconds // 3600}h"
+        elif seconds >= 60:
+            return f"{seconds // 60}m"
         else:
-            return f"{age.seconds}s"
+            return f"{seconds}s"
         
 
 def main():
@@ -275,35 +408,41 @@ def main():
     parser.add_argument("--replicas", type=int, help="Number of replicas for deployment")
     parser.add_argument("--list-pods", help="List all pods in the current namespace", action="store_true")
     args = parser.parse_args()
-    
-    k8s_cluster = DescribeK8s("default")
 
-    
+    # Read-only views: their data is fetched concurrently; errors and output
+    # are reported from the main thread in flag order.
+    dashboards = [
+        ("cluster_info", DescribeK8s._fetch_api_resources, DescribeK8s.get_api_resources,
+         DescribeK8s.print_cluster_info),
+        ("nodes", DescribeK8s._fetch_nodes, DescribeK8s.get_nodes, DescribeK8s.print_nodes_info),
+        ("list_namespaces", DescribeK8s._fetch_namespaces, DescribeK8s.get_all_namespaces,
+         DescribeK8s.print_namespaces_info),
+    ]
+    handlers = [
+        ("api_versions", lambda k: k.print_api_versions()),
+        ("apply", lambda k: k.apply(args.apply)),
+        ("create", lambda k: k.create(*args.create, args.replicas)),
+        ("list_pods", lambda k: k.list_pods()),
+    ]
+    views = [view for flag, *view in dashboards if getattr(args, flag)]
+    selected = [handler for flag, handler in handlers if getattr(args, flag)]
+    if not views and not selected and not args.switch_context:
+        parser.print_help()
+        return
 
-    
+    k8s_cluster = DescribeK8s(args.namespace or "default")
 
-    if args.namespace:
-        k8s_cluster.set_namespace(args.namespace)
-
-    if args.cluster_info:
-        k8s_cluster.print_cluster_info()
-    elif args.api_versions:
-        k8s_cluster.print_api_versions()
-    elif args.nodes:
-        k8s_cluster.print_nodes_info()
-    elif args.list_namespaces:
-        k8s_cluster.print_namespaces_info()
-    elif args.switch_context:
-        k8s_cluster.switch_context(args.switch_context)
-    elif args.apply:
-        k8s_cluster.apply(args.apply)
-    elif args.create:
-        resource_type, name, image = args.create
-        k8s_cluster.create(resource_type, name, image, args.replicas)
-    if args.list_pods:
-        k8s_cluster.list_pods()
-    else:
-        parser.print_help()
+    # Switch first so every other command talks to the requested context.
+    if args.switch_context and not k8s_cluster.switch_context(args.switch_context):
+        return
+
+    if views:
+        with ThreadPoolExecutor(max_workers=DASHBOARD_WORKERS) as executor:
+            futures = [executor.submit(fetch, k8s_cluster) for fetch, _, _ in views]
+            for (_, get, show), future in zip(views, futures):
+                show(k8s_cluster, get(k8s_cluster, future.result))
+    for handler in selected:
+        handler(k8s_cluster)
 
 
 if __name__ == "__main__":